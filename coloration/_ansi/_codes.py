@@ -2,10 +2,17 @@
 # SPDX-License-Identifier: MIT
 
 import enum
+import sys
 
 from ._constants import ANSI_ENCODING, ANSI_ENCODING_ERRORS, ANSI_8BIT_COLOR_NAMES
 
 
+# values of the 8-bit colors, by palette index; shared by both the named and the
+# indexed variants of the palette enums
+_FORE8_STR = tuple(f"38;5;{idx}" for idx in range(len(ANSI_8BIT_COLOR_NAMES)))
+_BACK8_STR = tuple(f"48;5;{idx}" for idx in range(len(ANSI_8BIT_COLOR_NAMES)))
+
+
 class AnsiCode:
     """
     Base class for every ANSI code enums and classes defined in this module
@@ -16,28 +23,18 @@ class AnsiCode:
     def __str__(self):
         return self.str_value
 
-    def __getattr__(self, name):
-        if name == "str_value":
-            value = str(self.value)
-            setattr(self, name, value)
-            return value
-
-        if name == "bin_value":
-            value = self.str_value.encode(ANSI_ENCODING, ANSI_ENCODING_ERRORS)
-            setattr(self, name, value)
-            return value
-
-        if name == "str_sequence":
-            value = self._build_sequence()
-            setattr(self, name, value)
-            return value
-
-        if name == "bin_sequence":
-            value = self.str_sequence.encode(ANSI_ENCODING, ANSI_ENCODING_ERRORS)
-            setattr(self, name, value)
-            return value
+    def _prime(self, str_value):
+        # precompute once for all the attributes read every time this code gets
+        # emitted, so they are plain attribute loads afterward
+        # pylint: disable=assigning-non-slot, attribute-defined-outside-init
+        self.str_value = str_value
+        self.bin_value = str_value.encode(ANSI_ENCODING, ANSI_ENCODING_ERRORS)
+        self.str_sequence = self._build_sequence()
+        self.bin_sequence = self.str_sequence.encode(
+            ANSI_ENCODING, ANSI_ENCODING_ERRORS)
 
-        raise AttributeError(name)
+    def _build_value(self):
+        return str(self.value)
 
     def _build_sequence(self):
         return self.str_value
@@ -52,23 +49,19 @@ class AnsiDynCode(AnsiCode):
     .. seealso:: `AnsiForeRgb` and `AnsiBackRgb`
     """
 
-    __slots__ = ("_str_value", "bin_value", "str_sequence", "bin_sequence")
+    __slots__ = ("str_value", "bin_value", "str_sequence", "bin_sequence")
 
     def __init__(self, str_value):
         assert isinstance(str_value, str)
         assert str_value
-        self._str_value = str_value
+        self._prime(str_value)
 
     def __str__(self):
-        return self._str_sequence
+        return self.str_sequence
 
     @property
-    def value(self):  # needed by AnsiCode.__getattr__()
-        return self._str_value
-
-    @property
-    def str_value(self):
-        return self._str_value
+    def value(self):
+        return self.str_value
 
 
 class AnsiSGRType:
@@ -80,9 +73,7 @@ class AnsiSGRType:
     __slots__ = ()
 
     def _build_sequence(self):
-        return "{}{}m".format(
-            AnsiEscape.CSI.str_value,
-            self.str_value)
+        return _CSI + self.str_value + "m"
 
 
 class AnsiColorType:
@@ -113,15 +104,10 @@ class Ansi8bitColorType:
     """
     __slots__ = ()
 
-    def __getattr__(self, name):
-        if name == "str_value":
-            value = "38" if isinstance(self, AnsiForeColorType) else "48"
-            value = f"{value};5;{self.value}"
-            # pylint: disable=assigning-non-slot, attribute-defined-outside-init
-            self.str_value = value
-            return value
-
-        return AnsiCode.__getattr__(self, name)
+    def _build_value(self):
+        if isinstance(self, AnsiForeColorType):
+            return _FORE8_STR[self.value]
+        return _BACK8_STR[self.value]
 
 
 class AnsiRgbColorType:
@@ -193,6 +179,24 @@ class AnsiEscape(AnsiCode, enum.Enum):
     STX = "\002"
 
 
+_CSI = AnsiEscape.CSI.value  # used by AnsiSGRType._build_sequence()
+
+
+# cursor movement codes are likely to be emitted in loops (e.g. once per line),
+# so the most common ones are built once and for all
+_CURSOR_CACHE_LEN = 65
+_CURSOR_UP = tuple(
+    AnsiDynCode(f"\033[{n}A") for n in range(_CURSOR_CACHE_LEN))
+_CURSOR_DOWN = tuple(
+    AnsiDynCode(f"\033[{n}B") for n in range(_CURSOR_CACHE_LEN))
+_CURSOR_FORWARD = tuple(
+    AnsiDynCode(f"\033[{n}C") for n in range(_CURSOR_CACHE_LEN))
+_CURSOR_BACKWARD = tuple(
+    AnsiDynCode(f"\033[{n}D") for n in range(_CURSOR_CACHE_LEN))
+_MOVE_TO_X = tuple(
+    AnsiDynCode(f"\033[{n+1}G") for n in range(_CURSOR_CACHE_LEN))
+
+
 class AnsiControl(AnsiCode, enum.Enum):
     """
     Some ANSI control codes related to screen and line erasing, showing/hiding
@@ -224,6 +228,8 @@ class AnsiControl(AnsiCode, enum.Enum):
         """Move cursor up"""
         assert isinstance(lines, int)
         assert lines >= 0
+        if 0 <= lines < _CURSOR_CACHE_LEN:
+            return _CURSOR_UP[lines]
         return AnsiDynCode(f"\033[{lines}A")
 
     @staticmethod
@@ -231,6 +237,8 @@ class AnsiControl(AnsiCode, enum.Enum):
         """Move cursor down"""
         assert isinstance(lines, int)
         assert lines >= 0
+        if 0 <= lines < _CURSOR_CACHE_LEN:
+            return _CURSOR_DOWN[lines]
         return AnsiDynCode(f"\033[{lines}B")
 
     @staticmethod
@@ -238,6 +246,8 @@ class AnsiControl(AnsiCode, enum.Enum):
         """Move cursor forward"""
         assert isinstance(columns, int)
         assert columns >= 0
+        if 0 <= columns < _CURSOR_CACHE_LEN:
+            return _CURSOR_FORWARD[columns]
         return AnsiDynCode(f"\033[{columns}C")
 
     @staticmethod
@@ -245,6 +255,8 @@ class AnsiControl(AnsiCode, enum.Enum):
         """Move cursor backward"""
         assert isinstance(columns, int)
         assert columns >= 0
+        if 0 <= columns < _CURSOR_CACHE_LEN:
+            return _CURSOR_BACKWARD[columns]
         return AnsiDynCode(f"\033[{columns}D")
 
     @staticmethod
@@ -252,6 +264,8 @@ class AnsiControl(AnsiCode, enum.Enum):
         """Move cursor to column *x*"""
         assert isinstance(x, int)
         assert x >= 0
+        if 0 <= x < _CURSOR_CACHE_LEN:
+            return _MOVE_TO_X[x]
         return AnsiDynCode(f"\033[{x+1}G")
 
     @staticmethod
@@ -312,7 +326,7 @@ class AnsiStdFore(
     LIGHTWHITE = 97
 
     def to_back(self):
-        return AnsiStdBack[self.name]
+        return self._counterpart  # set by _prime_ansi_codes()
 
 
 class AnsiStdBack(
@@ -346,7 +360,7 @@ class AnsiStdBack(
     LIGHTWHITE = 107
 
     def to_fore(self):
-        return AnsiStdFore[self.name]
+        return self._counterpart  # set by _prime_ansi_codes()
 
 
 class AnsiFore8(
@@ -368,11 +382,8 @@ class AnsiFore8(
     for _idx, _nam in enumerate(ANSI_8BIT_COLOR_NAMES):
         vars()[_nam] = _idx
 
-    def __getattr__(self, name):
-        return Ansi8bitColorType.__getattr__(self, name)
-
     def to_back(self):
-        return AnsiBack8[self.name]
+        return self._counterpart  # set by _prime_ansi_codes()
 
 
 class AnsiBack8(
@@ -394,11 +405,8 @@ class AnsiBack8(
     for _idx, _nam in enumerate(ANSI_8BIT_COLOR_NAMES):
         vars()[_nam] = _idx
 
-    def __getattr__(self, name):
-        return Ansi8bitColorType.__getattr__(self, name)
-
     def to_fore(self):
-        return AnsiFore8[self.name]
+        return self._counterpart  # set by _prime_ansi_codes()
 
 
 class AnsiFore8Index(
@@ -420,23 +428,18 @@ class AnsiFore8Index(
     for _idx in range(len(ANSI_8BIT_COLOR_NAMES)):
         vars()[f"FG8_{_idx}"] = _idx
 
-    def __getattr__(self, name):
-        return Ansi8bitColorType.__getattr__(self, name)
-
     def to_back(self):
-        return AnsiBack8Index[f"BG8_{self.value}"]
+        return self._counterpart  # set by _prime_ansi_codes()
 
     @classmethod
     def from_index(cls, color_index):
-        try:
-            return cls[f"FG8_{color_index}"]
-        except KeyError:
-            pass
-
         if not isinstance(color_index, int) or isinstance(color_index, bool):
             raise ValueError(f"8-bit color index value type {type(color_index)}")
 
-        raise ValueError(f"8-bit color index out of bounds: {color_index}")
+        if not 0 <= color_index < len(_FORE8_INDEX_CODES):
+            raise ValueError(f"8-bit color index out of bounds: {color_index}")
+
+        return _FORE8_INDEX_CODES[color_index]
 
 
 class AnsiBack8Index(
@@ -458,23 +461,47 @@ class AnsiBack8Index(
     for _idx in range(len(ANSI_8BIT_COLOR_NAMES)):
         vars()[f"BG8_{_idx}"] = _idx
 
-    def __getattr__(self, name):
-        return Ansi8bitColorType.__getattr__(self, name)
-
     def to_fore(self):
-        return AnsiFore8Index[f"FG8_{self.value}"]
+        return self._counterpart  # set by _prime_ansi_codes()
 
     @classmethod
     def from_index(cls, color_index):
-        try:
-            return cls[f"BG8_{color_index}"]
-        except KeyError:
-            pass
-
         if not isinstance(color_index, int) or isinstance(color_index, bool):
             raise ValueError(f"8-bit color index value type {type(color_index)}")
 
-        raise ValueError(f"8-bit color index out of bounds: {color_index}")
+        if not 0 <= color_index < len(_BACK8_INDEX_CODES):
+            raise ValueError(f"8-bit color index out of bounds: {color_index}")
+
+        return _BACK8_INDEX_CODES[color_index]
+
+
+# members of the indexed 8-bit color enums, in palette order
+_FORE8_INDEX_CODES = tuple(AnsiFore8Index)
+_BACK8_INDEX_CODES = tuple(AnsiBack8Index)
+
+
+# AnsiForeRgb and AnsiBackRgb objects kept for reuse, by class and components
+_RGB_CACHE = {}
+_RGB_CACHE_MAXLEN = 4096
+
+
+def _new_rgb_code(cls, prefix, red, green, blue):
+    # validate before the cache lookup: True and 1.0 would match the key of 1
+    assert red.__class__ is int and 0 <= red <= 255
+    assert green.__class__ is int and 0 <= green <= 255
+    assert blue.__class__ is int and 0 <= blue <= 255
+
+    key = (cls, red, green, blue)
+    code = _RGB_CACHE.get(key)
+    if code is None:
+        code = AnsiDynCode.__new__(cls)
+        AnsiDynCode.__init__(code, f"{prefix};2;{red};{green};{blue}")
+        code._rgb = (red, green, blue)  # pylint: disable=protected-access
+        if len(_RGB_CACHE) >= _RGB_CACHE_MAXLEN:
+            # evict the oldest entry
+            _RGB_CACHE.pop(next(iter(_RGB_CACHE)), None)
+        _RGB_CACHE[key] = code
+    return code
 
 
 class AnsiForeRgb(
@@ -486,20 +513,22 @@ class AnsiForeRgb(
     """
     A dynamic ANSI escape code to represent a foreground RBG color (24-bit)
     """
-    __slots__ = ()
+    __slots__ = ("_rgb", )
+
+    def __new__(cls, red, green, blue):
+        # objects are immutable, so reuse them since it is common for a program
+        # to emit the same few colors repeatedly
+        return _new_rgb_code(cls, "38", red, green, blue)
 
     def __init__(self, red, green, blue):
-        assert isinstance(red, int)
-        assert isinstance(green, int)
-        assert isinstance(blue, int)
-        assert 0 <= red <= 255
-        assert 0 <= green <= 255
-        assert 0 <= blue <= 255
-        AnsiDynCode.__init__(self, f"38;2;{red};{green};{blue}")
+        # pylint: disable=super-init-not-called
+        pass  # fully initialized by __new__()
+
+    def __reduce__(self):
+        return (self.__class__, self._rgb)
 
     def to_back(self):
-        red, green, blue = map(int, self.str_value.split(";")[2:5])
-        return AnsiBackRgb(red, green, blue)
+        return AnsiBackRgb(*self._rgb)
 
 
 class AnsiBackRgb(
@@ -511,17 +540,59 @@ class AnsiBackRgb(
     """
     A dynamic ANSI escape code to represent a background RBG color (24-bit)
     """
-    __slots__ = ()
+    __slots__ = ("_rgb", )
+
+    def __new__(cls, red, green, blue):
+        # objects are immutable, so reuse them since it is common for a program
+        # to emit the same few colors repeatedly
+        return _new_rgb_code(cls, "48", red, green, blue)
 
     def __init__(self, red, green, blue):
-        assert isinstance(red, int)
-        assert isinstance(green, int)
-        assert isinstance(blue, int)
-        assert 0 <= red <= 255
-        assert 0 <= green <= 255
-        assert 0 <= blue <= 255
-        AnsiDynCode.__init__(self, f"48;2;{red};{green};{blue}")
+        # pylint: disable=super-init-not-called
+        pass  # fully initialized by __new__()
+
+    def __reduce__(self):
+        return (self.__class__, self._rgb)
 
     def to_fore(self):
-        red, green, blue = map(int, self.str_value.split(";")[2:5])
-        return AnsiForeRgb(red, green, blue)
+        return AnsiForeRgb(*self._rgb)
+
+
+def _prime_ansi_codes():
+    # pylint: disable=protected-access
+
+    # values and sequences shared by several codes (e.g. 8-bit colors by name
+    # and by index) are deduplicated so that they all refer to the same objects
+    bin_pool = {}
+
+    def _dedup_bin(value):
+        return bin_pool.setdefault(value, value)
+
+    # CAUTION: enums must be iterated using attribute __members__ since it
+    # includes enum aliases (i.e. identical values with different names)
+    for enum_class in (
+            AnsiEscape, AnsiControl, AnsiStyle,
+            AnsiStdFore, AnsiStdBack,
+            AnsiFore8, AnsiBack8,
+            AnsiFore8Index, AnsiBack8Index):
+        for code in enum_class.__members__.values():
+            code._prime(sys.intern(code._build_value()))
+            code.str_sequence = sys.intern(code.str_sequence)
+            code.bin_value = _dedup_bin(code.bin_value)
+            code.bin_sequence = _dedup_bin(code.bin_sequence)
+
+    # link enum colors with their counterpart for to_back() and to_fore()
+    def _link_colors(fore, back):
+        fore._counterpart = back
+        back._counterpart = fore
+
+    for fore in AnsiStdFore:
+        _link_colors(fore, AnsiStdBack[fore.name])
+    for fore in AnsiFore8:
+        _link_colors(fore, AnsiBack8[fore.name])
+    for fore in AnsiFore8Index:
+        _link_colors(fore, _BACK8_INDEX_CODES[fore])
+
+
+_prime_ansi_codes()
+del _prime_ansi_codes
@@ -3,8 +3,6 @@
 
 __all__ = []  # populated by _expose_ansi_codes()
 
-_CODE_TO_NAME_MAP = {}  # populated by _expose_ansi_codes()
-
 
 def _expose_ansi_codes():
     """
@@ -37,18 +35,18 @@ def _expose_ansi_codes():
     from . import _codes
 
     glbls = globals()
+    bulk = {}  # new globals, published all at once at the end
 
     def _declare_enum_value(name, value):
+        # pylint: disable=protected-access
         assert isinstance(value, enum.Enum)
-        key = id(value)  # CAUTION: ansi_code_to_global_name() relies on this
-        assert key not in _CODE_TO_NAME_MAP
-        _CODE_TO_NAME_MAP[key] = name
+        assert "_global_name" not in vars(value)
+        value._global_name = name  # CAUTION: ansi_code_to_global_name()
 
     def _declare_global(name, value):
         assert name not in glbls
-        assert name not in __all__
-        glbls[name] = value
-        __all__.append(name)
+        assert name not in bulk
+        bulk[name] = value
 
     def _declare_enum(enum_class, *, prefix):
         # CAUTION: enums must be iterated using attribute __members__ since it
@@ -71,6 +69,9 @@ def _expose_ansi_codes():
     _declare_enum(_codes.AnsiFore8Index, prefix="")
     _declare_enum(_codes.AnsiBack8Index, prefix="")
 
+    glbls.update(bulk)
+    __all__.extend(bulk.keys())
+
 
 _expose_ansi_codes()
 del _expose_ansi_codes
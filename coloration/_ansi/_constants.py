@@ -24,6 +24,9 @@ ANSI_ENCODING_ERRORS = "strict"
 #: introduction sequence (i.e. CSI or OSC).
 ANSI_CODE_REGEX_STR = re.compile(
     r"""
+        # quick check of the first character so that the regex engine can skip
+        # right to the next candidate, since a SOH prefix is optional
+        (?=[\001\033])
         (?:
             # Control Sequence
             (?:
@@ -53,9 +56,40 @@ ANSI_CODE_REGEX_BIN = re.compile(
     ANSI_CODE_REGEX_STR.pattern.encode(ANSI_ENCODING, ANSI_ENCODING_ERRORS),
     ANSI_CODE_REGEX_STR.flags)
 
+# Same as `ANSI_CODE_REGEX_STR`, without the optional SOH prefix, so that it
+# starts with a literal ESC and the regex engine can scan plain text much
+# faster. Only to be used on data that does not contain any SOH character.
+_ANSI_CODE_NOSOH_REGEX_STR = re.compile(
+    r"""
+        \033  # ESC, CAUTION: must stay out of the alternation below
+        (?:
+            # Control Sequence
+            \[
+            [\x30-\x3f]*  # parameter bytes
+            [\x20-\x2f]*  # intermediate bytes
+            [\x40-\x7e]   # final byte
+            \002*         # STX
+            |
+            # Operating System Command
+            \]
+            [^\007\002]*
+            [\007|\002]+  # BEL and/or STX
+        )
+    """,
+    re.A | re.VERBOSE)
+
+# Same as `_ANSI_CODE_NOSOH_REGEX_STR` for `bytes` objects
+_ANSI_CODE_NOSOH_REGEX_BIN = re.compile(
+    _ANSI_CODE_NOSOH_REGEX_STR.pattern.encode(
+        ANSI_ENCODING, ANSI_ENCODING_ERRORS),
+    _ANSI_CODE_NOSOH_REGEX_STR.flags)
+
 
 #: Regular expression to find a Select Graphic Rendition (SGR) sequence that is
 #: not (or does not end with) a RESET code
+#
+# CAUTION: the pattern must keep starting with a literal CSI, which allows the
+# regex engine to jump right to the next candidate sequence
 ANSI_NONRESET_SGR_REGEX_STR = re.compile(
     r"""
         \033\[             # CSI, not necessarily a SGR yet
@@ -12,16 +12,19 @@ from ._codes import (
     AnsiColorType, AnsiForeColorType, AnsiBackColorType,
     AnsiStdFore, AnsiStdBack,
     AnsiFore8, AnsiForeRgb)
-from ._codes_flat import (
-    _CODE_TO_NAME_MAP, CSI_BIN, CSI_STR, RESET_BIN, RESET_STR)
+from ._codes_flat import CSI_BIN, CSI_STR, RESET_BIN, RESET_STR
 from ._constants import (
     ANSI_ENCODING, ANSI_ENCODING_ERRORS,
     ANSI_CODE_REGEX_STR, ANSI_CODE_REGEX_BIN,
+    _ANSI_CODE_NOSOH_REGEX_STR, _ANSI_CODE_NOSOH_REGEX_BIN,
     ANSI_NONRESET_SGR_REGEX_STR, ANSI_NONRESET_SGR_REGEX_BIN,
-    ANSI_AUTORESET_REGEX_BIN, ANSI_AUTORESET_REGEX_STR,
     ANSI_8BIT_COLOR_NAMES)
 
 
+_AUTORESET_TRAILING_STR = "\f\v\r\n"
+_AUTORESET_TRAILING_BIN = b"\f\v\r\n"
+
+
 def ansi_autoreset(data):
     """
     Append a `AnsiStyle.RESET` sequence to *data* only if it is non-empty, and a
@@ -36,23 +39,34 @@ def ansi_autoreset(data):
     if not data:
         return data
 
+    # nothing to do if there is no ESC at all, which is a much cheaper check
+    # than a regex search
+    if isinstance(data, str):
+        if "\033" not in data:
+            return data
+        nonreset_regex = ANSI_NONRESET_SGR_REGEX_STR
+        reset = RESET_STR
+        trailing = _AUTORESET_TRAILING_STR
+    else:
+        if isinstance(data, (bytes, bytearray)) and b"\033" not in data:
+            return data
+        nonreset_regex = ANSI_NONRESET_SGR_REGEX_BIN
+        reset = RESET_BIN
+        trailing = _AUTORESET_TRAILING_BIN
+
     try:
-        if not ANSI_NONRESET_SGR_REGEX_STR.search(data):
+        if not nonreset_regex.search(data):
             return data
     except TypeError:
-        try:
-            if not ANSI_NONRESET_SGR_REGEX_BIN.search(data):
-                return data
-        except TypeError:
-            raise ValueError("data")
-        else:
-            repl = RESET_BIN + br"\1"
-            regex = ANSI_AUTORESET_REGEX_BIN
-    else:
-        repl = RESET_STR + r"\1"
-        regex = ANSI_AUTORESET_REGEX_STR
+        raise ValueError("data")
+
+    if not isinstance(data, (str, bytes)):
+        data = bytes(data)
 
-    return regex.sub(repl, data, count=1)
+    # insert RESET right in front of trailing whitespaces, if any, which is
+    # what ANSI_AUTORESET_REGEX_* match
+    end = len(data.rstrip(trailing))
+    return data[:end] + reset + data[end:]
 
 
 def ansi_code_to_global_name(ansi_code):
@@ -63,8 +77,12 @@ def ansi_code_to_global_name(ansi_code):
     """
     if not isinstance(ansi_code, AnsiCode):
         raise ValueError(f"ansi_code type: {type(ansi_code)}")
-    key = id(ansi_code)  # as converted by _flatten_ansi_codes()
-    return _CODE_TO_NAME_MAP[key]
+    try:
+        # as assigned by _codes_flat._expose_ansi_codes()
+        return ansi_code._global_name  # pylint: disable=protected-access
+    except AttributeError:
+        # not a global code (e.g. an AnsiDynCode object)
+        raise KeyError(ansi_code)
 
 
 _COLOR_REGEX = re.compile(
@@ -92,6 +110,50 @@ _COLOR_REGEX = re.compile(
     re.A | re.VERBOSE)
 
 
+def _build_colors_by_name():
+    # color codes by their upper-cased name, as matched by _COLOR_REGEX, so
+    # that the most common cases can skip the regex in ansi_color()
+    colors = {}
+    for name in _codes_flat.__all__:
+        code = getattr(_codes_flat, name)
+        if isinstance(code, AnsiColorType):
+            rem = _COLOR_REGEX.fullmatch(name)
+            if rem and rem["name"]:  # CAUTION: hex values take precedence
+                for suffix in ("", "_STR", "_BIN"):
+                    colors[name + suffix] = code
+    return colors
+
+
+_COLORS_BY_NAME = _build_colors_by_name()
+del _build_colors_by_name
+
+
+def _common_color_from_str(color):
+    # fast paths of ansi_color() for the most common forms of color strings,
+    # for the exact same result as _COLOR_REGEX; return None if the regex
+    # has to be used instead
+    if not color.isascii():
+        return None
+
+    code = _COLORS_BY_NAME.get(color.upper())
+    if code is not None:
+        return code
+
+    if len(color) == 7 and color[0] == "#":
+        try:
+            rgb = bytes.fromhex(color[1:])
+        except ValueError:
+            return None
+        if len(rgb) == 3:
+            return AnsiForeRgb(*rgb)
+    elif len(color) <= 3 and color.isdigit():
+        color_idx = int(color, base=10)
+        if color_idx <= 255:
+            return AnsiFore8[ANSI_8BIT_COLOR_NAMES[color_idx]]
+
+    return None
+
+
 def ansi_color(color, green=None, blue=None):
     """
     Convert any kind of color supported by *coloration* into an `AnsiCode`
@@ -138,6 +200,10 @@ def ansi_color(color, green=None, blue=None):
             elif not isinstance(color, str):
                 raise ValueError(f"color value type: {type(color)}")
 
+            code = _common_color_from_str(color)
+            if code is not None:
+                return code
+
             rem = _COLOR_REGEX.fullmatch(color)
             if not rem:
                 raise ValueError("color")
@@ -195,13 +261,14 @@ def ansi_decode(data):
     `ANSI_ENCODING_ERRORS`, since *data* is assumed to contain ANSI escape
     sequence(s) only.
     """
-    if not data:
-        assert isinstance(data, (str, bytes, bytearray, re.Pattern))
-        return ""
+    # most common cases first
+    if isinstance(data, str):
+        return data
     elif isinstance(data, (bytes, bytearray)):
         return data.decode(ANSI_ENCODING, ANSI_ENCODING_ERRORS)
-    elif isinstance(data, str):
-        return data
+    elif not data:
+        assert isinstance(data, (str, bytes, bytearray, re.Pattern))
+        return ""
     elif isinstance(data, re.Pattern):
         if isinstance(data.pattern, bytes):
             pattern = data.pattern.decode(ANSI_ENCODING, ANSI_ENCODING_ERRORS)
@@ -225,19 +292,21 @@ def ansi_encode(data):
     `ANSI_ENCODING_ERRORS`, since *data* is assumed to contain ANSI escape
     sequence(s) only.
     """
-    if not data:
-        assert isinstance(data, (str, bytes, bytearray, re.Pattern))
-        return b""
+    # most common cases first
+    if isinstance(data, bytes):
+        return data
     elif isinstance(data, str):
         return data.encode(ANSI_ENCODING, ANSI_ENCODING_ERRORS)
-    elif isinstance(data, bytes):
-        return data
     elif isinstance(data, bytearray):
         return bytes(data)
+    elif not data:
+        assert isinstance(data, (str, bytes, bytearray, re.Pattern))
+        return b""
     elif isinstance(data, re.Pattern):
         if isinstance(data.pattern, str):
             pattern = data.pattern.encode(ANSI_ENCODING, ANSI_ENCODING_ERRORS)
-            return re.compile(pattern, flags=data.flags)
+            # re.UNICODE is implied for str patterns, and not allowed for bytes
+            return re.compile(pattern, flags=data.flags & ~re.UNICODE)
         elif isinstance(data.pattern, bytes):
             return data
         else:
@@ -313,10 +382,12 @@ def ansi_join(
     joined = []
     reset_flags = _JOINFLAG_NONE
 
+    accumulate_sgr = accumulated_sgr.append
+    join_append = joined.append
+
     for item in codes:
         if isinstance(item, AnsiSGRType):
-            item_value = item.bin_value if binary else item.str_value
-            accumulated_sgr.append(item_value)
+            accumulate_sgr(item.bin_value if binary else item.str_value)
             if autoreset:
                 if item is AnsiStyle.RESET:
                     reset_flags = _JOINFLAG_NONE
@@ -330,15 +401,14 @@ def ansi_join(
                     reset_flags |= _JOINFLAG_BGCOL
                 else:
                     reset_flags |= _JOINFLAG_STYLE
-        elif isinstance(item, AnsiCode):
-            _flush_sgr()
-            item = item.bin_sequence if binary else item.str_sequence
-            joined.append(item)
         elif isinstance(item, str):
             _flush_sgr()
             if binary:
                 item = item.encode(encoding, errors)
             _autoreset_append(item)
+        elif isinstance(item, AnsiCode):
+            _flush_sgr()
+            join_append(item.bin_sequence if binary else item.str_sequence)
         elif isinstance(item, (bytes, bytearray)):
             _flush_sgr()
             if not binary:
@@ -351,18 +421,19 @@ def ansi_join(
             item_value = str(item)
             if binary:
                 item_value = item_value.encode(encoding, errors)
-            _autoreset_append(item)
+            _autoreset_append(item_value)
 
     if autoreset and reset_flags != _JOINFLAG_NONE:
         if reset_flags & _JOINFLAG_STYLE:
-            code = RESET_BIN if binary else RESET_STR
-            accumulated_sgr.append(code)
+            accumulate_sgr(
+                AnsiStyle.RESET.bin_value if binary
+                else AnsiStyle.RESET.str_value)
         else:
             for flag, code in (
                     (_JOINFLAG_FGCOL, AnsiStdFore.DEFAULT),
                     (_JOINFLAG_BGCOL, AnsiStdBack.DEFAULT)):
                 if reset_flags & flag:
-                    accumulated_sgr.append(
+                    accumulate_sgr(
                         code.bin_value if binary else code.str_value)
 
     _flush_sgr()
@@ -378,13 +449,41 @@ def ansi_strip(data):
     if not data:
         return data
 
+    # nothing to do if there is no ESC at all, which is a much cheaper check
+    # than a regex search; otherwise, the SOH-less regex is much faster to scan
+    # plain text with, so pick it when possible
+    if isinstance(data, str):
+        if "\033" not in data:
+            return data
+        if "\001" in data:
+            regex = ANSI_CODE_REGEX_STR
+        else:
+            regex = _ANSI_CODE_NOSOH_REGEX_STR
+        empty = ""
+    elif isinstance(data, bytes):
+        if b"\033" not in data:
+            return data
+        if b"\001" in data:
+            regex = ANSI_CODE_REGEX_BIN
+        else:
+            regex = _ANSI_CODE_NOSOH_REGEX_BIN
+        empty = b""
+    else:
+        # other bytes-like objects (e.g. bytearray), always stripped to a bytes
+        # object
+        regex = ANSI_CODE_REGEX_BIN
+        empty = b""
+
     try:
-        return ANSI_CODE_REGEX_STR.sub("", data)
+        return regex.sub(empty, data)
     except TypeError:
-        try:
-            return ANSI_CODE_REGEX_BIN.sub(b"", data)
-        except TypeError:
-            raise ValueError("data")
+        raise ValueError("data")
+
+
+_TITLE_PREFIX_STR = AnsiEscape.OSC.str_value + "0;"  # can be 0, 1, or 2
+_TITLE_PREFIX_BIN = AnsiEscape.OSC.bin_value + b"0;"
+_TITLE_SUFFIX_STR = AnsiEscape.BEL.str_value
+_TITLE_SUFFIX_BIN = AnsiEscape.BEL.bin_value
 
 
 def ansi_title(title):
@@ -395,16 +494,8 @@ def ansi_title(title):
     The returned sequence can be written directly to a file.
     """
     if isinstance(title, str):
-        return "".join((
-            AnsiEscape.OSC.str_value,
-            "0;",  # can be 0, 1, or 2
-            title,
-            AnsiEscape.BEL.str_value))
+        return f"{_TITLE_PREFIX_STR}{title}{_TITLE_SUFFIX_STR}"
     elif isinstance(title, (bytes, bytearray)):
-        return b"".join((
-            AnsiEscape.OSC.bin_value,
-            b"0;",  # can be 0, 1, or 2
-            title,
-            AnsiEscape.BEL.bin_value))
+        return _TITLE_PREFIX_BIN + title + _TITLE_SUFFIX_BIN
     else:
         raise ValueError("title")
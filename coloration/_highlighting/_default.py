@@ -25,6 +25,10 @@ class BasicHighlighter(RegexHighlighter):
         # option...
         re.compile(  # noqa: DUO138
             r"""
+                # quick check of the first character so that the regex engine
+                # can skip right to the next candidate; CAUTION: must allow the
+                # first character of every alternative below
+                (?=[\w\\\-\+])
                 (?:
                     \b(?P<none>None)\b|
                     \b(?P<false>False)\b|
@@ -138,6 +142,8 @@ class ExtendedHighlighter(BasicHighlighter):
     _highlights_ = (
         re.compile(
             r"""
+                # quick check of the first character, see BasicHighlighter
+                (?=[\w\[\*])
                 (?:
                     (?P<uri>
                         [a-zA-Z][a-zA-Z0-9\-\+\.]*
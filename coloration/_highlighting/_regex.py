@@ -14,7 +14,15 @@ from .._ansi import ansi_decode, ansi_encode
 
 
 class RegexHighlighter(Highlighter):
-    """Base abstract class for automatic regex-based text highlighting"""
+    """
+    Base abstract class for automatic regex-based text highlighting.
+
+    Regexes and replacements (``_highlights_`` and ``_highlights_repl_``) are
+    prepared once per class and mode, then shared by all the instances. They
+    are prepared again upon instantiation if the content of these attributes
+    has changed since, so they can be replaced or modified in place, but
+    already existing instances keep using their original preparation.
+    """
 
     Repl = HighlighterRepl
 
@@ -27,6 +35,33 @@ class RegexHighlighter(Highlighter):
 
         binary = bool(binary)
 
+        # preparation only depends on the class, on binary mode, and on the
+        # content of the _highlights_* attributes, so it is done once per class
+        # and mode, and done again if any of these attributes has been replaced
+        # or modified in place since
+        cls = type(self)
+        prepared_cache = vars(cls).get("_prepared_cache_")
+        if prepared_cache is None:
+            prepared_cache = {}
+            cls._prepared_cache_ = prepared_cache
+
+        highlights = self._highlights_
+        highlights_repl = self._highlights_repl_
+        key = (tuple(highlights), tuple(highlights_repl.items()))
+        prepared = prepared_cache.get(binary)
+        if prepared is None or prepared[0] != key:
+            prepared = (
+                key, *self._prepare(highlights, highlights_repl, binary))
+            prepared_cache[binary] = prepared
+
+        self._is_binary = binary
+        self._regexes = prepared[1]
+        self._repls = prepared[2]
+        self._repls_by_index = prepared[3]
+        self._empty = prepared[4]
+
+    @staticmethod
+    def _prepare(highlights, highlights_repl, binary):
         if binary:
             regex_convert = ansi_encode
             repl_class = HighlighterPreparedReplBin
@@ -35,21 +70,29 @@ class RegexHighlighter(Highlighter):
             repl_class = HighlighterPreparedReplStr
 
         regexes = []
-        for regex in self._highlights_:
+        for regex in highlights:
             if not isinstance(regex, re.Pattern):
                 raise ValueError(f"regex expected; got type {type(regex)}")
             regexes.append(regex_convert(regex))
 
         repls = {}
-        for repl_name, repl_value in self._highlights_repl_.items():
+        for repl_name, repl_value in highlights_repl.items():
             if not isinstance(repl_value, HighlighterRepl):
                 raise ValueError(f"regex expected; got type {type(repl_value)}")
             repls[repl_name] = repl_class(repl_value)
 
-        self._is_binary = binary
-        self._regexes = tuple(regexes)
-        self._repls = repls
-        self._empty = repl_class.EMPTY
+        # for every regex, the prepared repl of each of its groups, by group
+        # index; None for unnamed groups
+        fallback_repl = repls.get(None, repl_class.EMPTY)
+        repls_by_index = []
+        for regex in regexes:
+            regex_repls = [None] * (regex.groups + 1)
+            for group_name, group_index in regex.groupindex.items():
+                regex_repls[group_index] = repls.get(group_name, fallback_repl)
+            repls_by_index.append(tuple(regex_repls))
+
+        return (
+            tuple(regexes), repls, tuple(repls_by_index), repl_class.EMPTY)
 
     @property
     def is_binary(self):
@@ -57,43 +100,6 @@ class RegexHighlighter(Highlighter):
         return self._is_binary
 
     def highlight(self, data):
-        def _do_repl(region, match):
-            empty_match = True
-            prev_end = 0
-
-            for match_name, match_value in match.groupdict().items():
-                if match_value is None:
-                    continue  # empty match
-
-                mstart, mend = match.span(match_name)
-                if mstart < prev_end:
-                    continue  # this part already matched
-
-                # TEST
-                # print(
-                #     f"_HLMATCH_ <{match_name} [{mstart}:{mend}]> "
-                #     f"{match_value!r}")
-
-                try:
-                    repl = self._repls[match_name]
-                except KeyError:
-                    repl = self._repls.get(None, self._empty)
-
-                assert isinstance(repl, HighlighterPreparedRepl)
-                repl = repl.replace_with(match_value)
-
-                region.insert_span(HighlighterSpan(mstart, mend, repl))
-                empty_match = False
-                prev_end = mend
-
-            # reaching this assertion means the regex is not optimized as it
-            # allows empty matches, which means this function will be called
-            # much more often, for every character in the worst case, looping in
-            # match.groupdict() every time
-            if __debug__:
-                if empty_match and self._assert_unoptimized_regex_:
-                    raise AssertionError("unoptimized regex")
-
         if not data:
             return self._empty
         elif not self._is_binary:
@@ -102,14 +108,110 @@ class RegexHighlighter(Highlighter):
         elif not isinstance(data, bytes):
             raise ValueError(f"expected bytes data; got {type(data)}")
 
+        # with a single regex, matches cannot overlap each other so they can be
+        # replaced in a single pass, without tracking a region for the whole
+        # data
+        if len(self._regexes) == 1 and self._assert_unoptimized_regex_:
+            repls_by_index = self._repls_by_index[0]
+
+            def _sub_repl(match):
+                group_index = self._whole_match_group(match, repls_by_index)
+                if group_index is not None:
+                    repl = repls_by_index[group_index]
+                    assert isinstance(repl, HighlighterPreparedRepl)
+                    return repl.replace_with(match.group(group_index))
+
+                region = HighlighterRegion(match.start(), match.end())
+                self._do_repl(region, match, repls_by_index)
+                return self._join_region(data, region)
+
+            return self._regexes[0].sub(_sub_repl, data)
+
         region = HighlighterRegion(0, len(data))
 
-        for regex in self._regexes:
+        for regex, repls_by_index in zip(self._regexes, self._repls_by_index):
             for span in region:
                 if span.data is None:  # this part did not match a regex already
                     for match in regex.finditer(data, span.start, span.end):
-                        _do_repl(region, match)
-
+                        self._do_repl(region, match, repls_by_index)
+
+        return self._join_region(data, region)
+
+    @staticmethod
+    def _whole_match_group(match, repls_by_index):
+        # fast path: return the index of the named group that spans the whole
+        # match, as long as no other named group matched, which is always the
+        # case with a top-level alternation of named groups; return None
+        # otherwise, so that named groups are walked by the caller
+        group_index = match.lastindex
+        if (group_index is None or
+                repls_by_index[group_index] is None or
+                match.span(group_index) != match.span()):
+            return None
+
+        # quick check: no other group matched at all
+        groups = match.groups()
+        if groups.count(None) == len(groups) - 1:
+            return group_index
+
+        # unnamed groups may have matched as well, only named ones matter
+        for other_index, repl in enumerate(repls_by_index):
+            if (repl is not None and
+                    other_index != group_index and
+                    groups[other_index - 1] is not None):
+                return None
+
+        return group_index
+
+    @staticmethod
+    def _insert_repl(region, repl, match_value, mstart, mend):
+        assert isinstance(repl, HighlighterPreparedRepl)
+        repl = repl.replace_with(match_value)
+        region.insert_span(HighlighterSpan(mstart, mend, repl))
+
+    def _do_repl(self, region, match, repls_by_index):
+        group_index = self._whole_match_group(match, repls_by_index)
+        if group_index is not None:
+            mstart, mend = match.span(group_index)
+            self._insert_repl(
+                region, repls_by_index[group_index], match.group(group_index),
+                mstart, mend)
+            return
+
+        empty_match = True
+        prev_end = 0
+
+        for match_name, match_value in match.groupdict().items():
+            if match_value is None:
+                continue  # empty match
+
+            mstart, mend = match.span(match_name)
+            if mstart < prev_end:
+                continue  # this part already matched
+
+            # TEST
+            # print(
+            #     f"_HLMATCH_ <{match_name} [{mstart}:{mend}]> "
+            #     f"{match_value!r}")
+
+            try:
+                repl = self._repls[match_name]
+            except KeyError:
+                repl = self._repls.get(None, self._empty)
+
+            self._insert_repl(region, repl, match_value, mstart, mend)
+            empty_match = False
+            prev_end = mend
+
+        # reaching this assertion means the regex is not optimized as it allows
+        # empty matches, which means this function will be called much more
+        # often, for every character in the worst case, looping in
+        # match.groupdict() every time
+        if __debug__:
+            if empty_match and self._assert_unoptimized_regex_:
+                raise AssertionError("unoptimized regex")
+
+    def _join_region(self, data, region):
         result = []
         for span in region:
             if span.data is None:
@@ -118,5 +220,4 @@ class RegexHighlighter(Highlighter):
                 res = span.data
             result.append(res)
 
-        result = self._empty.join(result)
-        return result
+        return self._empty.join(result)
@@ -63,13 +63,22 @@ class HighlighterRepl:
             coloration.STD_GREEN, 2)
     """
 
-    __slots__ = ("_sequence", "_autoreset")
+    __slots__ = ("_sequence", "_autoreset", "_prepared")
 
     def __init__(self, *sequence, autoreset=True):
         self._sequence = sequence
         self._autoreset = autoreset
+        self._prepared = [None, None]  # indexed by int(binary)
 
     def prepare(self, *, binary):
+        binary = bool(binary)
+        prepared = self._prepared[binary]
+        if prepared is None:
+            prepared = self._prepare(binary)
+            self._prepared[binary] = prepared
+        return prepared
+
+    def _prepare(self, binary):
         # handle special cases
         if not self._sequence:
             return (0, )
@@ -105,20 +114,17 @@ class HighlighterRepl:
 
         sequence = ansi_join(
             *result, binary=binary, autostr=False, autoreset=self._autoreset)
-        result = []
-        start = 0
+        # split() alternates literal parts and placeholder indexes, since the
+        # regex has a single capturing group
         repl_regex = _DUMMY_REPL_REGEX_BIN if binary else _DUMMY_REPL_REGEX_STR
+        parts = repl_regex.split(sequence)
+        result = []
 
-        while start < len(sequence):
-            if not (rem := repl_regex.search(sequence, start)):
-                result.append(sequence[start:])
-                break
-
-            mstart, mend = rem.span(0)
-            if mstart > start:
-                result.append(sequence[start:mstart])
-            result.append(int(rem[1], base=10))
-            start = mend
+        for idx, part in enumerate(parts):
+            if idx % 2:
+                result.append(int(part, base=10))
+            elif part:
+                result.append(part)
 
         return tuple(result)
 
@@ -129,7 +135,7 @@ class HighlighterPreparedRepl:
     `HighlighterPreparedReplBin`. Not meant to be instanciated directly.
     """
 
-    __slots__ = ("_repl", )
+    __slots__ = ("_repl", "_static", "_identity")
 
     IS_BINARY = None
     EMPTY = None
@@ -148,14 +154,34 @@ class HighlighterPreparedRepl:
         assert isinstance(repl, tuple)
 
         self._repl = repl
+        self._static = self._prepare_static(repl)
+        self._identity = repl == (0, )  # replaced by match group 0 as-is
+
+    def _prepare_static(self, repl):
+        # return the replacement value if it does not depend on the matched
+        # values, or None
+        if len(repl) == 1 and repl[0] is None:
+            return self.EMPTY
+
+        if any(isinstance(item, int) for item in repl):
+            return None
+
+        try:
+            return self.EMPTY.join(repl)
+        except TypeError:
+            return None  # let replace_with() raise
 
     def __call__(self, *args, **kwargs):
         return self.replace_with(*args, **kwargs)
 
     def replace_with(self, *repl):
-        # special case
-        if len(self._repl) == 1 and self._repl[0] is None:
-            return self.EMPTY
+        # the result does not depend on *repl* if there is no placeholder
+        if self._static is not None:
+            return self._static
+
+        # same result as joining a single value of the expected type
+        if self._identity and repl and repl[0].__class__ is self.EMPTY.__class__:
+            return repl[0]
 
         result = []
 
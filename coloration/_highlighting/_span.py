@@ -1,16 +1,7 @@
 # Copyright (c) Jean-Charles Lefebvre
 # SPDX-License-Identifier: MIT
 
-import itertools
-
-
-try:
-    _pairwise = itertools.pairwise  # 3.10
-except AttributeError:
-    def _pairwise(iterable):
-        a, b = itertools.tee(iterable)
-        next(b, None)
-        return zip(a, b)
+import operator
 
 
 class HighlighterSpan:
@@ -27,6 +18,16 @@ class HighlighterSpan:
         self._end = end
         self._data = data
 
+    @classmethod
+    def _unchecked(cls, start, end, data=None):
+        # same as the constructor, minus the sanity checks; for internal use
+        # with already validated values only
+        span = cls.__new__(cls)
+        span._start = start
+        span._end = end
+        span._data = data
+        return span
+
     def __repr__(self):
         return "<{} [{}:{}] data={!r}>".format(
             self.__class__.__name__, self._start, self._end, self._data)
@@ -49,8 +50,11 @@ class HighlighterSpan:
         return self._data
 
 
+_span_start = operator.attrgetter("_start")
+
+
 class HighlighterRegion:
-    __slots__ = ("_start", "_end", "_spans")
+    __slots__ = ("_start", "_end", "_spans", "_sorted", "_gen", "_iterated")
 
     def __init__(self, start, end):
         assert isinstance(start, int)
@@ -62,30 +66,50 @@ class HighlighterRegion:
         self._start = start
         self._end = end
         self._spans = []
+        self._sorted = True
+        self._gen = 0  # incremented by insert_span()
+        self._iterated = None  # (gen, spans) of the last complete iteration
 
     def __iter__(self):
+        # spans and gaps are materialized from a snapshot of the inserted
+        # spans, so the result can be reused until the next insert_span()
+        iterated = self._iterated
+        if iterated is None or iterated[0] != self._gen:
+            iterated = (self._gen, tuple(self._iter_spans()))
+            self._iterated = iterated
+
+        yield from iterated[1]
+
+    def _iter_spans(self):
+        if not self._sorted:
+            # stable sort, so spans with the same start keep their insertion
+            # order
+            self._spans.sort(key=_span_start)
+            self._sorted = True
+
+        _gap = HighlighterSpan._unchecked  # pylint: disable=protected-access
+
         if not self._spans:
-            yield HighlighterSpan(self._start, self._end)
+            yield _gap(self._start, self._end)
         else:
-            spans = self._spans[:]
-
-            if self._start < spans[0].start:
-                yield HighlighterSpan(self._start, spans[0].start)
-
-            if len(spans) == 1:
-                yield spans[0]
-            else:
-                first = True
-                for span1, span2 in _pairwise(spans):
-                    if first:
-                        yield span1
-                        first = False
-                    if span1.end < span2.start:
-                        yield HighlighterSpan(span1.end, span2.start)
-                    yield span2
-
-            if spans[-1].end < self._end:
-                yield HighlighterSpan(spans[-1].end, self._end)
+            spans = self._spans
+            span = spans[0]
+
+            if self._start < span.start:
+                yield _gap(self._start, span.start)
+
+            yield span
+            prev_end = span.end
+
+            for idx in range(1, len(spans)):
+                span = spans[idx]
+                if prev_end < span.start:
+                    yield _gap(prev_end, span.start)
+                yield span
+                prev_end = span.end
+
+            if prev_end < self._end:
+                yield _gap(prev_end, self._end)
 
     @property
     def start(self):
@@ -96,9 +120,11 @@ class HighlighterRegion:
         return self._end
 
     def insert_span(self, newspan):
-        nstart = newspan.start
-        for idx, span in enumerate(self._spans):
-            if nstart < span.start:
-                self._spans.insert(idx, newspan)
-                return
-        self._spans.append(newspan)
+        # spans are most often inserted in order, since regex matches are
+        # found from left to right; otherwise defer sorting to the next
+        # iteration, so that a whole pass costs a single sort
+        self._gen += 1
+        spans = self._spans
+        if self._sorted and spans and newspan.start < spans[-1].start:
+            self._sorted = False
+        spans.append(newspan)
@@ -559,70 +559,6 @@ class ColorationStream:
         Note that both *hl* and *autoreset* options, if enabled, are applied
         only if escaping is allowed (see constructor's arguments).
         """
-        def _flush_sgr():
-            nonlocal accumulated_sgr
-            if accumulated_sgr:
-                if self._can_style:
-                    yield self._csi
-                    yield self._semicolon.join(accumulated_sgr)
-                    yield self._m
-                accumulated_sgr.clear()
-
-        def _flush_sep():
-            nonlocal must_emit_sep
-            if must_emit_sep:
-                yield sep
-                must_emit_sep = False
-
-        def _iter():
-            nonlocal accumulated_sgr
-            nonlocal must_emit_sep
-
-            for item in objs:
-                if isinstance(item, AnsiSGRType):
-                    if self._can_style:
-                        if self._is_binary:
-                            accumulated_sgr.append(item.bin_value)
-                        else:
-                            accumulated_sgr.append(item.str_value)
-                    elif accumulated_sgr:
-                        accumulated_sgr.clear()
-                elif isinstance(item, AnsiCode):
-                    if self._can_escape:
-                        yield from _flush_sgr()
-                        if self._is_binary:
-                            yield item.bin_sequence
-                        else:
-                            yield item.str_sequence
-                elif isinstance(item, str):
-                    if self._is_binary:
-                        item = item.encode(self._encoding, self._encoding_errors)
-                    yield from _flush_sep()
-                    yield from _flush_sgr()
-                    yield item
-                    must_emit_sep = True
-                # elif isinstance(item, (bytes, bytearray)):
-                #     if not self._is_binary:
-                #         item = item.decode(self._encoding, self._encoding_errors)
-                #     yield from _flush_sep()
-                #     yield from _flush_sgr()
-                #     yield item
-                #     must_emit_sep = True
-                else:
-                    item = str(item)
-                    if self._is_binary:
-                        item = item.encode(self._encoding, self._encoding_errors)
-                    yield from _flush_sep()
-                    yield from _flush_sgr()
-                    yield item
-                    must_emit_sep = True
-
-            if accumulated_sgr:
-                yield from _flush_sgr()
-
-        accumulated_sgr = []  # accumulator for SGR sequences
-        must_emit_sep = False
-
         if sep is None:
             sep = self._default_sep
         elif sep is False:
@@ -631,16 +567,78 @@ class ColorationStream:
         if end is None:
             end = self._default_end
 
-        data = list(_iter())
-        if end:
-            data.append(end)
+        if len(objs) == 1 and objs[0].__class__ is str:
+            # fast path for the most common call: a single str object
+            if self._is_binary:
+                data = objs[0].encode(self._encoding, self._encoding_errors)
+            else:
+                data = objs[0]
+            if end:
+                data += end
+        else:
+            is_binary = self._is_binary
+            can_style = self._can_style
+            can_escape = self._can_escape
+            encoding = self._encoding
+            encoding_errors = self._encoding_errors
+            csi = self._csi
+            semicolon = self._semicolon
+            m_suffix = self._m
+
+            data = []
+            data_append = data.append
+            accumulated_sgr = []  # accumulator for SGR sequences
+            must_emit_sep = False
+
+            for item in objs:
+                # exact str objects are the most common items
+                if item.__class__ is not str:
+                    if isinstance(item, AnsiSGRType):
+                        if can_style:
+                            if is_binary:
+                                accumulated_sgr.append(item.bin_value)
+                            else:
+                                accumulated_sgr.append(item.str_value)
+                        continue
+                    if isinstance(item, AnsiCode):
+                        if can_escape:
+                            if accumulated_sgr:
+                                data.extend((
+                                    csi, semicolon.join(accumulated_sgr),
+                                    m_suffix))
+                                accumulated_sgr.clear()
+                            if is_binary:
+                                data_append(item.bin_sequence)
+                            else:
+                                data_append(item.str_sequence)
+                        continue
+                    if not isinstance(item, str):
+                        # note: bytes and bytearray objects go through str()
+                        item = str(item)
+
+                if is_binary:
+                    item = item.encode(encoding, encoding_errors)
+                if must_emit_sep:
+                    data_append(sep)
+                if accumulated_sgr:
+                    data.extend((
+                        csi, semicolon.join(accumulated_sgr), m_suffix))
+                    accumulated_sgr.clear()
+                data_append(item)
+                must_emit_sep = True
+
+            if accumulated_sgr:
+                data.extend((csi, semicolon.join(accumulated_sgr), m_suffix))
+
+            if end:
+                data_append(end)
+
+            data = self._empty.join(data)
 
         if data:
             # duplicate and reimplement write() features here because of hl and
             # autoreset arguments
 
-            data = self._empty.join(data)
-
             if self._can_autostrip:
                 # hl and autoreset ignored in this case
                 data = ansi_strip(data)
@@ -2,9 +2,44 @@
 # SPDX-License-Identifier: MIT
 
 import atexit
+import functools
 import os
 import sys
 
+# whether unwrap_std_streams() has been registered as an atexit handler
+_atexit_registered = False
+
+
+@functools.lru_cache(maxsize=None)
+def _win32_console_api():
+    # resolved and prototyped only once, upon first call
+    import ctypes
+    import ctypes.wintypes
+
+    STD_OUTPUT_HANDLE = ctypes.wintypes.DWORD(-11).value
+    STD_ERROR_HANDLE = ctypes.wintypes.DWORD(-12).value
+    INVALID_HANDLE_VALUE = ctypes.wintypes.HANDLE(-1).value
+
+    GetLastError = ctypes.windll.kernel32.GetLastError
+    GetLastError.restype = ctypes.wintypes.DWORD
+    GetLastError.argtypes = []
+
+    GetStdHandle = ctypes.windll.kernel32.GetStdHandle
+    GetStdHandle.restype = ctypes.wintypes.HANDLE
+    GetStdHandle.argtypes = [ctypes.wintypes.DWORD]
+
+    GetConsoleMode = ctypes.windll.kernel32.GetConsoleMode
+    GetConsoleMode.restype = ctypes.wintypes.BOOL
+    GetConsoleMode.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.LPDWORD]
+
+    SetConsoleMode = ctypes.windll.kernel32.SetConsoleMode
+    SetConsoleMode.restype = ctypes.wintypes.BOOL
+    SetConsoleMode.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD]
+
+    return (
+        STD_OUTPUT_HANDLE, STD_ERROR_HANDLE, INVALID_HANDLE_VALUE,
+        GetLastError, GetStdHandle, GetConsoleMode, SetConsoleMode)
+
 
 def enable_windows_vt100(*, stdout=True, stderr=True, raise_errors=False):
     """
@@ -37,26 +72,11 @@ def enable_windows_vt100(*, stdout=True, stderr=True, raise_errors=False):
     import ctypes
     import ctypes.wintypes
 
-    STD_OUTPUT_HANDLE = ctypes.wintypes.DWORD(-11).value
-    STD_ERROR_HANDLE = ctypes.wintypes.DWORD(-12).value
     ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
-    INVALID_HANDLE_VALUE = ctypes.wintypes.HANDLE(-1).value
-
-    GetLastError = ctypes.windll.kernel32.GetLastError
-    GetLastError.restype = ctypes.wintypes.DWORD
-    GetLastError.argtypes = []
-
-    GetStdHandle = ctypes.windll.kernel32.GetStdHandle
-    GetStdHandle.restype = ctypes.wintypes.HANDLE
-    GetStdHandle.argtypes = [ctypes.wintypes.DWORD]
 
-    GetConsoleMode = ctypes.windll.kernel32.GetConsoleMode
-    GetConsoleMode.restype = ctypes.wintypes.BOOL
-    GetConsoleMode.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.LPDWORD]
-
-    SetConsoleMode = ctypes.windll.kernel32.SetConsoleMode
-    SetConsoleMode.restype = ctypes.wintypes.BOOL
-    SetConsoleMode.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD]
+    (STD_OUTPUT_HANDLE, STD_ERROR_HANDLE, INVALID_HANDLE_VALUE,
+     GetLastError, GetStdHandle, GetConsoleMode,
+     SetConsoleMode) = _win32_console_api()
 
     def _enable_vt100(std_handle_id):
         handle = GetStdHandle(std_handle_id)
@@ -190,6 +210,8 @@ def wrap_std_streams(**colorstream_kwargs):
 
     .. seealso:: `unwrap_std_streams()`
     """
+    global _atexit_registered  # pylint: disable=global-statement
+
     from ._stream import ColorationStream
 
     for stream_name in ("stdout", "stderr"):
@@ -202,5 +224,6 @@ def wrap_std_streams(**colorstream_kwargs):
         assert not stream.owns_wrapped
         setattr(sys, stream_name, stream)
 
-    atexit.unregister(unwrap_std_streams)  # in case this is not the first time
-    atexit.register(unwrap_std_streams)
+    if not _atexit_registered:
+        atexit.register(unwrap_std_streams)
+        _atexit_registered = True
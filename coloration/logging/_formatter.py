@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import re
+import time
 
 from . import _logging
 
@@ -21,11 +22,43 @@ class ColorationLogFormatter(_logging.Formatter):
     def __init__(self, /, **kwargs):
         super().__init__(**kwargs)
 
+        # datefmt value -> its parts around MSECS_REGEX matches
+        self._datefmt_parts = {}
+
+        # (seconds, datefmt parts, converter, strftime-ed parts) of the last
+        # formatted time, reused by records emitted within the same second
+        self._last_time = (None, None, None, None)
+
         # modify formatter's defaults
         # self.default_time_format = "%Y-%m-%d %H:%M:%S"
         # self.default_msec_format = "%s.%03d"
 
     def formatTime(self, record, datefmt=None, **kwargs):
-        if datefmt:
-            datefmt = self.MSECS_REGEX.sub(f"{int(record.msecs):03}", datefmt)
-        return super().formatTime(record, datefmt=datefmt, **kwargs)
+        if not datefmt or kwargs:
+            return super().formatTime(record, datefmt=datefmt, **kwargs)
+
+        try:
+            parts = self._datefmt_parts[datefmt]
+        except KeyError:
+            parts = tuple(self.MSECS_REGEX.split(datefmt))
+            self._datefmt_parts[datefmt] = parts
+
+        secs = int(record.created)
+        converter = self.converter
+        last_time = self._last_time
+
+        if (last_time[0] == secs and
+                last_time[1] is parts and
+                last_time[2] == converter):
+            times = last_time[3]
+        else:
+            ct = converter(record.created)
+            if len(parts) == 1:
+                times = (time.strftime(datefmt, ct), )
+            else:
+                times = tuple(map(time.strftime, parts, (ct, ) * len(parts)))
+            self._last_time = (secs, parts, converter, times)
+
+        if len(times) == 1:
+            return times[0]
+        return f"{int(record.msecs):03}".join(times)
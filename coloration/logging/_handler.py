@@ -12,6 +12,8 @@ from .._highlighting import select_highlighter
 from .._stream import ColorationStream
 from .._utils import is_file_tty
 
+_DEFAULT_SOURCEINFO_FORMAT = " <{record.module}:{record.lineno}>"
+
 
 class ColorationStreamHandler(_logging.StreamHandler):
     """A wrapper around `logging.StreamHandler` to have colored log lines"""
@@ -76,7 +78,7 @@ class ColorationStreamHandler(_logging.StreamHandler):
     SOURCEINFO_STYLE = _ansi.FG8_60  # MEDIUM_PURPLE_4
 
     #: Default format of the *source* field, for a TTY stream
-    SOURCEINFO_FORMAT_TTY = " <{record.module}:{record.lineno}>"
+    SOURCEINFO_FORMAT_TTY = _DEFAULT_SOURCEINFO_FORMAT
 
     #: Default format of the *source* field, for a non-TTY stream
     SOURCEINFO_FORMAT_NONTTY = SOURCEINFO_FORMAT_TTY
@@ -202,6 +204,8 @@ class ColorationStreamHandler(_logging.StreamHandler):
         self._srcinfo_format = (
             self.SOURCEINFO_FORMAT_TTY if is_tty
             else self.SOURCEINFO_FORMAT_NONTTY)
+        self._srcinfo_default_format = (
+            self._srcinfo_format == _DEFAULT_SOURCEINFO_FORMAT)
         self._levelname_map = (
             self.LEVELNAME_MAP_TTY if is_tty
             else self.LEVELNAME_MAP_NONTTY)
@@ -220,6 +224,11 @@ class ColorationStreamHandler(_logging.StreamHandler):
                 highlighter, binary=stream.is_binary)
             self._srcinfo_style = self.join_styles(self.SOURCEINFO_STYLE)
 
+        # final level part of the levels found in self._levelname_map
+        self._levelname_parts = {
+            levelno: self._format_levelname(levelno, levelname)
+            for levelno, levelname in self._levelname_map.items()}
+
     def setFormatter(self, *args, **kwargs):
         # method inherited from logging.Handler
         raise NotImplementedError("feature disabled by this Handler")
@@ -229,13 +238,8 @@ class ColorationStreamHandler(_logging.StreamHandler):
         raise NotImplementedError("feature disabled by this Handler")
 
     def format(self, record, *args, **kwargs):
-        def _append(*items):
-            if output:
-                output.append(sep)
-            output.extend(items)
-
+        # fields are joined with a single space
         output = []
-        sep = " "
         rst = _ansi.RESET_STR
 
         # date part
@@ -245,24 +249,16 @@ class ColorationStreamHandler(_logging.StreamHandler):
                 datefmt=self.formatter.datefmt)
 
             if self._date_style:
-                _append(self._date_style, part, rst)
-            else:
-                _append(part)
+                part = self._date_style + part + rst
+            output.append(part)
 
         # level part
         if self._insert_level:
-            part = self._levelname_map.get(record.levelno, record.levelname)
-
-            if not self._levelname_style_map:
-                _append(part)
-            else:
-                try:
-                    style = self._levelname_style_map[record.levelno]
-                except KeyError:
-                    _append(part)
-                else:
-                    if style:
-                        _append(style, part, rst)
+            part = self._levelname_parts.get(record.levelno, False)
+            if part is False:
+                part = self._format_levelname(record.levelno, record.levelname)
+            if part is not None:
+                output.append(part)
 
         # message part: prepare highlighting if needed
         if self._highlighter is not None:
@@ -279,6 +275,7 @@ class ColorationStreamHandler(_logging.StreamHandler):
                 record.exc_text = self.formatter.formatException(record.exc_info)
 
             orig_getmsg = record.getMessage
+            orig_getmsg_is_attr = "getMessage" in record.__dict__
             orig_exctext = record.exc_text
             orig_stackinfo = record.stack_info
 
@@ -294,24 +291,46 @@ class ColorationStreamHandler(_logging.StreamHandler):
         try:
             part = super().format(record, *args, **kwargs)
         finally:
-            if self._highlighter is None:
-                _append(part)
-            else:
-                record.getMessage = orig_getmsg
+            if self._highlighter is not None:
+                if orig_getmsg_is_attr:
+                    record.getMessage = orig_getmsg
+                else:
+                    # do not store the bound method into the record since it
+                    # would create a reference cycle
+                    del record.getMessage
                 record.exc_text = orig_exctext
                 record.stack_info = orig_stackinfo
                 del orig_getmsg, orig_exctext, orig_stackinfo
-                _append(part, rst)
+
+        if self._highlighter is None:
+            output.append(part)
+        else:
+            output.append(part + rst)
 
         # srcinfo part
         if record.levelno <= self._srcinfo_maxlevel:
-            part = self._srcinfo_format.format(record=record)
-            if not self._srcinfo_style:
-                _append(part)
+            if self._srcinfo_default_format:
+                # same as _DEFAULT_SOURCEINFO_FORMAT, without str.format()
+                part = f" <{record.module}:{record.lineno}>"
             else:
-                _append(self._srcinfo_style, part, rst)
+                part = self._srcinfo_format.format(record=record)
+            if self._srcinfo_style:
+                part = self._srcinfo_style + part + rst
+            output.append(part)
+
+        return " ".join(output)
 
-        return "".join(output)
+    def _format_levelname(self, levelno, levelname):
+        # return the styled level part, or None if it must be omitted
+        if not self._levelname_style_map:
+            return levelname
+
+        try:
+            style = self._levelname_style_map[levelno]
+        except KeyError:
+            return levelname
+        else:
+            return style + levelname + _ansi.RESET_STR if style else None
 
     @staticmethod
     def join_styles(styles):
@@ -135,10 +135,10 @@ def get_logger(name=None, **kwargs):
     For that reason, it is recommended to use this function instead of
     `logging.getLogger`.
     """
-    with _lock:
-        logger = logging.getLogger(name, **kwargs)
-        logger = patch_logger(logger)
-        return logger
+    # no need to hold the lock here: logging.getLogger() is thread-safe and
+    # patch_logger() locks on its own if needed
+    logger = logging.getLogger(name, **kwargs)
+    return patch_logger(logger)
 
 
 #: Shorthand to `get_logger` for API compatibility
@@ -147,10 +147,9 @@ getLogger = get_logger
 
 def has_logger(name):
     """Check if a logger designed by *name* already exists"""
-    with _lock:
-        if not name:
-            raise ValueError("no name")
-        return name in BaseLogger.manager.loggerDict
+    if not name:
+        raise ValueError("no name")
+    return name in BaseLogger.manager.loggerDict
 
 
 def patch_logger(logger):
@@ -163,8 +162,12 @@ def patch_logger(logger):
 
     Return *logger*.
     """
+    # this test includes our own Logger and LoggerAdapter classes already
+    if isinstance(logger, CustomLoggerMixin):
+        return logger
+
     with _lock:
-        # this test includes our own Logger and LoggerAdapter classes already
+        # test again now that the lock is held, in case of a concurrent call
         if not isinstance(logger, CustomLoggerMixin):
             if not isinstance(logger, (BaseLogger, BaseLoggerAdapter)):
                 raise ValueError(f"logger type not supported: {type(logger)}")
@@ -15,7 +15,7 @@ def color8_box(color_index, *, width=5):
     assert isinstance(color_index, int)
     assert 0 <= color_index <= 255
 
-    back = getattr(color, f"BG8_{color_index}")
+    back = color.AnsiBack8Index.from_index(color_index)
 
     # foreground color (black or white)
     if color_index < 8:
@@ -1,7 +1,6 @@
 # Copyright (c) Jean-Charles Lefebvre
 # SPDX-License-Identifier: MIT
 
-import contextlib
 import os
 import os.path
 import subprocess
@@ -18,21 +17,6 @@ EXCLUDED_DIRS = (
     "t", "temp", "tmp")
 
 
-@contextlib.contextmanager
-def scoped_chdir(chdir=None):
-    if not chdir:
-        oldwd = None
-    else:
-        oldwd = os.getcwd()
-        os.chdir(chdir)
-
-    try:
-        yield
-    finally:
-        if oldwd:
-            os.chdir(oldwd)
-
-
 def safety_checks():
     if not sys.executable:
         raise RuntimeError("no sys.executable")
@@ -50,30 +34,33 @@ def safety_checks():
 def list_project_python_packages():
     packages = []
 
-    with scoped_chdir(PROJECT_DIR):
-        with os.scandir() as dirit:
-            for direntry in dirit:
-                if not direntry.name or direntry.name[0] in (".", "_"):
-                    continue
+    with os.scandir(PROJECT_DIR) as dirit:
+        for direntry in dirit:
+            if not direntry.name or direntry.name[0] in (".", "_"):
+                continue
 
-                if direntry.name.lower() in EXCLUDED_DIRS:
-                    continue
+            if direntry.name.lower() in EXCLUDED_DIRS:
+                continue
 
-                if not direntry.is_dir(follow_symlinks=False):
-                    continue
+            if not direntry.is_dir(follow_symlinks=False):
+                continue
 
-                initpy = os.path.join(direntry.path, "__init__.py")
-                if not os.path.isfile(initpy):
-                    continue
+            initpy = os.path.join(direntry.path, "__init__.py")
+            if not os.path.isfile(initpy):
+                continue
 
-                packages.append(os.path.normpath(direntry.path))
+            # relative to PROJECT_DIR, which is the linters' working dir
+            packages.append(direntry.name)
 
     return packages
 
 
 def run_linters(targets):
     discovered_packages = None
+    processes = []
 
+    # linters are independent from each other so run them concurrently, and
+    # capture their output so it is printed in order, once a linter is done
     for linter, linter_args in LINTERS.items():
         if not targets and linter == "pylint":
             # pylint requires an explicit input
@@ -89,9 +76,18 @@ def run_linters(targets):
             sys.executable, "-B", "-m", linter,
             *linter_args, *linter_targets]
 
+        proc = subprocess.Popen(  # pylint: disable=consider-using-with
+            cmdargs, cwd=PROJECT_DIR,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        processes.append((linter, targets_msg, proc))
+
+    for linter, targets_msg, proc in processes:
+        output, _ = proc.communicate()
+
         print(f" >> LINTER {linter}: {targets_msg}", flush=True)
-        res = subprocess.run(cmdargs, cwd=PROJECT_DIR, check=False)
-        print(f" -- LINTER {linter}: exit code {res.returncode}", flush=True)
+        sys.stdout.buffer.write(output)
+        sys.stdout.buffer.flush()
+        print(f" -- LINTER {linter}: exit code {proc.returncode}", flush=True)
 
 
 def main(args=None):
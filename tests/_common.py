@@ -13,7 +13,7 @@ class TestCaseBase(unittest.TestCase):
 
     def tearDown(self):
         # try to emit a RESET sequence in case something went wrong
-        for stream in (sys.stderr, sys.stderr):
+        for stream in (sys.stdout, sys.stderr):
             try:
                 stream.reset_style()  # ColorationStream method
             except AttributeError:
@@ -1,6 +1,7 @@
 # Copyright (c) Jean-Charles Lefebvre
 # SPDX-License-Identifier: MIT
 
+import re
 import unittest
 
 import coloration
@@ -9,6 +10,22 @@ from ._common import TestCaseBase
 
 
 class TestAnsi(TestCaseBase):
+    def test_ansi_autoreset(self):
+        self.assertEqual(coloration.ansi_autoreset("hello\n"), "hello\n")
+        self.assertEqual(
+            coloration.ansi_autoreset("\x1b[1mhello"), "\x1b[1mhello\x1b[0m")
+        self.assertEqual(
+            coloration.ansi_autoreset("\x1b[1mhello\r\n"),
+            "\x1b[1mhello\x1b[0m\r\n")
+        self.assertEqual(
+            coloration.ansi_autoreset(bytearray(b"\x1b[1mhello\n")),
+            b"\x1b[1mhello\x1b[0m\n")
+        self.assertEqual(
+            coloration.ansi_autoreset(memoryview(b"\x1b[1mhello\n")),
+            b"\x1b[1mhello\x1b[0m\n")
+        with self.assertRaises(ValueError):
+            coloration.ansi_autoreset(123)
+
     def test_ansi_color(self):
         for hexcolor in (("#040506", ), (b"#040506", ), (4, 5, 6)):
             fore = coloration.ansi_color(*hexcolor)
@@ -22,6 +39,10 @@ class TestAnsi(TestCaseBase):
             self.assertEqual(fore.bin_value, b"38;2;4;5;6")
             self.assertEqual(fore.str_sequence, "\033[38;2;4;5;6m")
             self.assertEqual(fore.bin_sequence, b"\033[38;2;4;5;6m")
+            self.assertEqual(str(fore), "\033[38;2;4;5;6m")
+
+        self.assertIs(coloration.AnsiForeRgb(4, 5, 6), fore)
+        self.assertFalse(hasattr(fore, "__dict__"))
 
         back = fore.to_back()
         self.assertIsInstance(back, coloration.AnsiBackRgb)
@@ -34,6 +55,36 @@ class TestAnsi(TestCaseBase):
         self.assertEqual(back.bin_value, b"48;2;4;5;6")
         self.assertEqual(back.str_sequence, "\033[48;2;4;5;6m")
         self.assertEqual(back.bin_sequence, b"\033[48;2;4;5;6m")
+        self.assertIs(back.to_fore(), fore)
+        self.assertFalse(hasattr(back, "__dict__"))
+
+    def test_ansi_color_rgb_args(self):
+        # cold: no object cached yet for these components
+        for args in ((True, 2, 203), (1, 2.0, 203), (1, 2, 256), (-1, 2, 203)):
+            with self.assertRaises(AssertionError):
+                coloration.AnsiForeRgb(*args)
+
+        # warm: values comparing equal to cached ones must be rejected as well
+        coloration.AnsiForeRgb(1, 2, 203)
+        coloration.AnsiBackRgb(1, 2, 203)
+        for args in ((True, 2, 203), (1, 2.0, 203), (1.0, 2, 203)):
+            with self.assertRaises(AssertionError):
+                coloration.AnsiForeRgb(*args)
+            with self.assertRaises(AssertionError):
+                coloration.AnsiBackRgb(*args)
+
+    def test_ansi_color8_index(self):
+        fore = coloration.AnsiFore8Index.from_index(196)
+        back = coloration.AnsiBack8Index.from_index(196)
+        self.assertIs(fore, coloration.FG8_196)
+        self.assertIs(back, coloration.BG8_196)
+        self.assertIs(fore.to_back(), back)
+        self.assertIs(back.to_fore(), fore)
+        for color_index in (-1, 256, True, "196"):
+            with self.assertRaises(ValueError):
+                coloration.AnsiFore8Index.from_index(color_index)
+            with self.assertRaises(ValueError):
+                coloration.AnsiBack8Index.from_index(color_index)
 
     def test_ansi_decode(self):
         self.assertEqual("", coloration.ansi_decode(b""))
@@ -44,6 +95,8 @@ class TestAnsi(TestCaseBase):
     def test_ansi_encode(self):
         self.assertEqual(b"", coloration.ansi_encode(""))
         self.assertEqual(b"Hello World!", coloration.ansi_encode("Hello World!"))
+        self.assertEqual(
+            coloration.ansi_encode(re.compile(r"\w+")).pattern, rb"\w+")
         with self.assertRaises(ValueError):
             coloration.ansi_encode(123)
 
@@ -62,6 +115,15 @@ class TestAnsi(TestCaseBase):
             "\x1b[38;2;255;255;0;48;2;0;0;255mworld"
             "\x1b[38;2;255;0;255m!"))
 
+        self.assertEqual(
+            coloration.ansi_join(coloration.BOLD, "hello", autoreset=True),
+            "\x1b[1mhello\x1b[0m")
+        self.assertEqual(
+            coloration.ansi_join(123, coloration.RED, b"!", binary=True),
+            b"123\x1b[38;5;1m!")
+        with self.assertRaises(ValueError):
+            coloration.ansi_join(123, autostr=False)
+
     def test_ansi_strip(self):
         data = (
             "\x1b[38;2;255;0;0mhello "
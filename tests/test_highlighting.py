@@ -1,6 +1,7 @@
 # Copyright (c) Jean-Charles Lefebvre
 # SPDX-License-Identifier: MIT
 
+import re
 import unittest
 
 import coloration
@@ -58,21 +59,93 @@ class TestHighlighting(TestCaseBase):
         )
 
         hl = coloration.select_highlighter()
-        tests_it = iter(TESTS)
-        while True:
-            try:
-                orig = next(tests_it)
-            except StopIteration:
-                break
-
-            expected = next(tests_it)
-
+        self.assertEqual(len(TESTS) % 2, 0)
+        for orig, expected in zip(TESTS[0::2], TESTS[1::2]):
             # print(repr(orig) + ",")
             # print(repr(hl(orig)) + ",")
             # print()
 
             self.assertEqual(hl(orig), expected)
 
+    def test_highlighting_binary(self):
+        # instances of a same class share their preparation, by mode
+        for _ in range(2):
+            hl_str = coloration.select_highlighter()
+            hl_bin = coloration.select_highlighter(binary=True)
+            self.assertEqual(hl_str("foo=123"), (
+                "\x1b[38;5;208mfoo\x1b[39m\x1b[38;5;202m=\x1b[39m"
+                "\x1b[38;5;51m123\x1b[39m"))
+            self.assertEqual(hl_bin(b"foo=123"), (
+                b"\x1b[38;5;208mfoo\x1b[39m\x1b[38;5;202m=\x1b[39m"
+                b"\x1b[38;5;51m123\x1b[39m"))
+
+    def test_highlighting_nested_groups(self):
+        # named groups are walked in order when more than one of them matched,
+        # even if the last one spans the whole match
+        Repl = coloration.HighlighterRepl
+        regex = re.compile(r"(?=(?P<kw>foo))(?P<word>(?P<char>\w)+)")
+        repls = {
+            "kw": Repl("<K>", 0, "</K>"),
+            "word": Repl("<W>", 0, "</W>"),
+            "char": Repl("<C>", 0, "</C>")}
+
+        class SingleRegexHighlighter(coloration.RegexHighlighter):
+            _highlights_ = (regex, )
+            _highlights_repl_ = repls
+
+        class MultiRegexHighlighter(coloration.RegexHighlighter):
+            _highlights_ = (regex, re.compile(r"(?P<word>bar)"))
+            _highlights_repl_ = repls
+
+        self.assertEqual(
+            SingleRegexHighlighter()("food bar"), "<K>foo</K><C>d</C> bar")
+        self.assertEqual(
+            MultiRegexHighlighter()("food bar"),
+            "<K>foo</K><C>d</C> <W>bar</W>")
+
+    def test_highlighting_modified_class(self):
+        # preparation is shared by instances, but not stale once the class
+        # attributes are modified in place
+        Repl = coloration.HighlighterRepl
+
+        class TestHighlighter(coloration.RegexHighlighter):
+            _highlights_ = [re.compile(r"(?P<word>foo)")]
+            _highlights_repl_ = {"word": Repl("<A>", 0, "</A>")}
+
+        hl1 = TestHighlighter()
+        self.assertEqual(hl1("foo bar"), "<A>foo</A> bar")
+
+        TestHighlighter._highlights_repl_["word"] = Repl("<B>", 0, "</B>")
+        hl2 = TestHighlighter()
+        self.assertEqual(hl2("foo bar"), "<B>foo</B> bar")
+
+        TestHighlighter._highlights_.append(re.compile(r"(?P<word>bar)"))
+        hl3 = TestHighlighter()
+        self.assertEqual(hl3("foo bar"), "<B>foo</B> <B>bar</B>")
+
+        # existing instances keep their original preparation
+        self.assertEqual(hl1("foo bar"), "<A>foo</A> bar")
+        self.assertEqual(hl2("foo bar"), "<B>foo</B> bar")
+
+    def test_highlighting_repl(self):
+        HighlighterRepl = coloration.HighlighterRepl
+
+        self.assertEqual(HighlighterRepl().prepare(binary=False), (0, ))
+        self.assertEqual(HighlighterRepl(None).prepare(binary=True), (None, ))
+        self.assertEqual(HighlighterRepl(1, 3).prepare(binary=False), (1, 3))
+        self.assertEqual(
+            HighlighterRepl(coloration.STD_RED, 1).prepare(binary=False),
+            ("\x1b[31m", 1, "\x1b[39m"))
+        self.assertEqual(
+            HighlighterRepl(
+                coloration.STD_RED, 1, autoreset=False).prepare(binary=True),
+            (b"\x1b[31m", 1))
+        self.assertEqual(
+            HighlighterRepl(
+                coloration.STD_BLUE, 1,
+                coloration.STD_GREEN, 2).prepare(binary=False),
+            ("\x1b[34m", 1, "\x1b[32m", 2, "\x1b[39m"))
+
 
 if __name__ == "__main__":
     unittest.main()